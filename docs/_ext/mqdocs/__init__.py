@@ -22,6 +22,10 @@ from .directives import (
     MsCnMathAutosummary,
     MsCnNoteAutosummary,
     MsCnPlatformAutosummary,
+    on_build_finished,
+    on_env_merge_info,
+    on_env_purge_doc,
+    on_env_updated,
 )
 from .autogen import on_builder_inited
 from .normalize import normalize_py_property_option
@@ -45,6 +49,12 @@ def setup(app: Sphinx):
     app.connect("builder-inited", on_builder_inited)
     # Normalize upstream RST patterns before parsing
     app.connect("source-read", normalize_py_property_option)
+    # Collect missing CN summaries per document and report them once
+    app.connect("env-purge-doc", on_env_purge_doc)
+    app.connect("env-merge-info", on_env_merge_info)
+    app.connect("env-updated", on_env_updated)
+    # Release per-build lookup caches
+    app.connect("build-finished", on_build_finished)
 
     return {
         "version": "1.0",
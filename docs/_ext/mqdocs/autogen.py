@@ -1,44 +1,184 @@
 from __future__ import annotations
 
+import functools
+import os
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from sphinx.application import Sphinx
 
 
-RE_ANY_AUTOSUMMARY = re.compile(
-    r"^\.\.\s+((ms[a-z]+autosummary)|autosummary)::\s*$",
-    re.IGNORECASE,
+# A whole autosummary-like directive: header line plus its blank/indented body.
+# The header starts with the literal '..' (then checked to begin a line) rather
+# than a MULTILINE '^', so the engine can jump between '..' occurrences instead
+# of trying every position; only the directive name is case-insensitive.
+RE_ANY_AUTOSUMMARY_BLOCK = re.compile(
+    r"\.\.(?<![^\n]\.\.)\s+(?i:ms[a-z]+autosummary|autosummary)::[^\S\n]*(?:\n|\Z)"
+    r"(?P<body>(?:[^\S\n]*\n| [^\n]*\n?)*)"
 )
+# Meaningful lines of an autosummary body: ':toctree:' or an item. Blank
+# lines, other options and '.. ' comments never match. Values are taken
+# greedily up to their last non-space character, so trailing blanks cost one
+# backtrack instead of a retry at every character.
+_RE_BLOCK_ENTRY = re.compile(
+    r"^ [^\S\n]*(?:"
+    r":toctree:[^\S\n]*(?P<toctree>\S(?:[^\n]*\S)?)?"
+    r"|(?!:|\.\. )(?P<item>\S(?:[^\n]*\S)?)"
+    r")[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Parsed autosummary blocks of one RST file: [(toctree_dir, items), ...]
+Blocks = List[Tuple[Optional[str], List[str]]]
+
+# Scan cache persisted under the doctree dir: path -> (st_mtime_ns, st_size, blocks)
+_CACHE_NAME = "mqdocs_autogen.cache"
+_CACHE_VERSION = 1
+# Touched after a complete stub pass; nothing newer in srcdir means nothing to do
+_MARKER_NAME = "mqdocs_stubs.done"
+
+# Below this many files to parse, pool startup costs more than it saves
+_PARALLEL_MIN_FILES = 64
+_PARALLEL_CHUNKSIZE = 32
 
+_O_BINARY = getattr(os, "O_BINARY", 0)
 
-def _parse_autosummary_block(
-    lines: List[str], start_idx: int
-) -> Tuple[Optional[str], List[str], int]:
-    """Parse an autosummary-like block (supports ms*autosummary and autosummary).
 
-    Returns: (toctree_dir, items, end_index)
+def _parse_autosummary_block(body: str) -> Tuple[Optional[str], List[str]]:
+    """Parse the body of an autosummary-like block (ms*autosummary and autosummary).
+
+    Returns: (toctree_dir, items)
     """
     toctree_dir: Optional[str] = None
     items: List[str] = []
-    i = start_idx + 1
-    # Consume indented block (options and items)
-    while i < len(lines) and (not lines[i].strip() or lines[i].startswith(" ")):
-        ln = lines[i]
-        if ln.strip().startswith(":toctree:"):
-            # Matches ':toctree: path'
-            _, _, rest = ln.partition(":toctree:")
-            toctree_dir = rest.strip() or None
-        elif ln.strip().startswith(":"):
-            # other options ignored
+    # The regex engine skips uninteresting lines; Python only sees the entries
+    for toctree, item in _RE_BLOCK_ENTRY.findall(body):
+        if item:
+            items.append(item)
+        else:
+            toctree_dir = toctree or None
+    return toctree_dir, items
+
+
+def _scan_blocks(text: str) -> Blocks:
+    """Return every autosummary-like block found in an RST source.
+
+    Both the directive search and the body scan run inside the regex engine;
+    the rest of the file is skipped without per-line Python work.
+    """
+    return [
+        _parse_autosummary_block(m.group("body"))
+        for m in RE_ANY_AUTOSUMMARY_BLOCK.finditer(text)
+    ]
+
+
+def _iter_tree(root: str) -> Iterator[os.DirEntry]:
+    """Yield entries for every .rst file and non-hidden directory below root.
+
+    Uses os.scandir so directory entries carry their type (and, on Windows,
+    their stat) without extra syscalls.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            stack.append(entry.path)
+                            yield entry
+                    elif entry.name.endswith(".rst"):
+                        yield entry
+                except OSError:
+                    continue
+
+
+def _iter_rst(root: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """Yield (path, stat) for every .rst file below root, skipping hidden dirs."""
+    for entry in _iter_tree(root):
+        try:
+            if not entry.is_dir(follow_symlinks=False):
+                yield entry.path, entry.stat()
+        except OSError:
+            continue
+
+
+def _latest_mtime_ns(root: str) -> int:
+    """Newest mtime among RST files and directories (catches adds/removes) under root."""
+    try:
+        latest = os.stat(root).st_mtime_ns
+    except OSError:
+        return 0
+    for entry in _iter_tree(root):
+        try:
+            latest = max(latest, entry.stat().st_mtime_ns)
+        except OSError:
+            continue
+    return latest
+
+
+def _read_text(path: str, size: int) -> str:
+    """Read a whole UTF-8 file with one unbuffered read of known size."""
+    fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    try:
+        data = os.read(fd, size)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8")
+
+
+def _read_blocks(path: str, size: int) -> Optional[Blocks]:
+    """Read and scan one RST file; None when it cannot be read."""
+    try:
+        text = _read_text(path, size)
+    except Exception:
+        return None
+    return _scan_blocks(text)
+
+
+def _read_all_blocks(files: List[Tuple[str, int]]) -> List[Optional[Blocks]]:
+    """Scan many (path, size) RST files, fanning out to worker processes for large batches."""
+    paths = [path for path, _size in files]
+    sizes = [size for _path, size in files]
+    if len(files) >= _PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+                return list(ex.map(_read_blocks, paths, sizes, chunksize=_PARALLEL_CHUNKSIZE))
+        except Exception:
+            # Pools may be unavailable (sandboxing, frozen builds); scan inline
             pass
-        elif ln.strip():
-            items.append(ln.strip())
-        i += 1
-    # Clean items (drop comments/empty)
-    items = [it for it in items if it and not it.startswith(".. ")]
-    return toctree_dir, items, i
+    return [_read_blocks(path, size) for path, size in files]
+
+
+def _load_cache(path: Path) -> Dict[str, Tuple[int, int, Blocks]]:
+    try:
+        with path.open("rb") as f:
+            version, entries = pickle.load(f)
+    except Exception:
+        return {}
+    if version != _CACHE_VERSION or not isinstance(entries, dict):
+        return {}
+    return entries
+
+
+def _save_cache(path: Path, entries: Dict[str, Tuple[int, int, Blocks]]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            pickle.dump((_CACHE_VERSION, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+# Name tails that mark a class even when not CamelCase
+_CLASS_SUFFIXES = ("Gate", "Channel", "Layer", "Ops", "Operator")
 
 
 def _guess_directive_by_name(qualname: str) -> str:
@@ -53,9 +193,7 @@ def _guess_directive_by_name(qualname: str) -> str:
         return "automodule"
     tail = qualname.rsplit(".", 1)[-1]
     # Heuristics: CamelCase or typical class suffixes
-    if tail[:1].isupper() or any(
-        tail.endswith(s) for s in ("Gate", "Channel", "Layer", "Ops", "Operator")
-    ):
+    if tail[:1].isupper() or tail.endswith(_CLASS_SUFFIXES):
         return "autoclass"
     # snake_case likely means function
     if tail.lower() == tail or "_" in tail:
@@ -63,6 +201,12 @@ def _guess_directive_by_name(qualname: str) -> str:
     return "py:obj"
 
 
+@functools.lru_cache(maxsize=None)
+def _underline(length: int) -> str:
+    # Title lengths repeat heavily across stubs; share one string per length
+    return "=" * length
+
+
 def _generate_stub_content(qualname: str) -> str:
     """Generate a stable stub without importing target objects.
 
@@ -71,7 +215,7 @@ def _generate_stub_content(qualname: str) -> str:
     """
     directive = _guess_directive_by_name(qualname)
     title = qualname
-    underline = "=" * len(title)
+    underline = _underline(len(title))
 
     if directive == "automodule":
         body = (
@@ -100,7 +244,7 @@ def _generate_stub_content(qualname: str) -> str:
     return f"{title}\n{underline}\n\n{body}\n"
 
 
-def _needs_rewrite(path: Path) -> bool:
+def _needs_rewrite(path: str) -> bool:
     """Detect obviously broken/generated stubs from previous runs.
 
     Rewrites when:
@@ -108,7 +252,8 @@ def _needs_rewrite(path: Path) -> bool:
     - autodata directives combined with ':members:' (invalid)
     """
     try:
-        text = path.read_text(encoding="utf-8").lower()
+        with open(path, encoding="utf-8") as f:
+            text = f.read().lower()
     except Exception:
         return False
     if ".. currentmodule:: i\n" in text or ".. currentmodule:: i\r\n" in text:
@@ -118,9 +263,23 @@ def _needs_rewrite(path: Path) -> bool:
     return False
 
 
-def _write_file(path: Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+def _write_file(path: str, content: str) -> None:
+    encoded = content.encode("utf-8")
+    # Leave identical files alone so their mtime (and Sphinx's doctree) stays valid
+    try:
+        with open(path, "rb") as f:
+            if f.read() == encoded:
+                return
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = memoryview(encoded)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def _clean_filename(name: str) -> str:
@@ -138,26 +297,53 @@ def on_builder_inited(app: Sphinx) -> None:
     lang = (getattr(app.config, 'language', '') or '').lower()
     if lang.startswith('zh'):
         return
-    srcdir = Path(app.srcdir)
-    for rst in srcdir.rglob("*.rst"):
-        try:
-            text = rst.read_text(encoding="utf-8")
-        except Exception:
+    srcdir = os.fspath(app.srcdir)
+    marker = Path(app.doctreedir) / _MARKER_NAME
+    try:
+        marker_mtime_ns: Optional[int] = marker.stat().st_mtime_ns
+    except OSError:
+        marker_mtime_ns = None
+    if marker_mtime_ns is not None and _latest_mtime_ns(srcdir) <= marker_mtime_ns:
+        return
+    cache_path = Path(app.doctreedir) / _CACHE_NAME
+    cache = _load_cache(cache_path)
+    entries: Dict[str, Tuple[int, int, Blocks]] = {}
+    # Unchanged sources reuse their parsed blocks; their stubs were already
+    # validated when first scanned, so only missing ones are regenerated.
+    hits: List[Tuple[str, Blocks]] = []
+    misses: List[Tuple[str, os.stat_result]] = []
+    for rst, st in _iter_rst(srcdir):
+        cached = cache.get(rst)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            entries[rst] = cached
+            hits.append((rst, cached[2]))
+        else:
+            misses.append((rst, st))
+    parsed = _read_all_blocks([(rst, st.st_size) for rst, st in misses])
+
+    work: List[Tuple[str, Blocks, bool]] = [(rst, blocks, True) for rst, blocks in hits]
+    for (rst, st), blocks in zip(misses, parsed):
+        if blocks is None:
             continue
-        lines = text.splitlines()
-        i = 0
-        while i < len(lines):
-            if RE_ANY_AUTOSUMMARY.match(lines[i] or ""):
-                toctree_dir, items, i = _parse_autosummary_block(lines, i)
-                # Destination folder: under the source file directory (like autosummary)
-                base_dir = rst.parent
-                if toctree_dir:
-                    base_dir = (base_dir / toctree_dir).resolve()
-                # Generate missing stubs
-                for qualname in items:
-                    outfile = base_dir / (_clean_filename(qualname) + ".rst")
-                    if (not outfile.exists()) or _needs_rewrite(outfile):
-                        content = _generate_stub_content(qualname)
-                        _write_file(outfile, content)
-            else:
-                i += 1
+        entries[rst] = (st.st_mtime_ns, st.st_size, blocks)
+        work.append((rst, blocks, False))
+
+    # Hot loop stays on plain str paths to avoid per-stub Path construction
+    join, exists = os.path.join, os.path.exists
+    for rst, blocks, hit in work:
+        for toctree_dir, items in blocks:
+            # Destination folder: under the source file directory (like autosummary)
+            base_dir = os.path.dirname(rst)
+            if toctree_dir:
+                base_dir = os.path.normpath(join(base_dir, toctree_dir))
+            # Generate missing stubs
+            for qualname in items:
+                outfile = join(base_dir, _clean_filename(qualname) + ".rst")
+                if not exists(outfile) or (not hit and _needs_rewrite(outfile)):
+                    content = _generate_stub_content(qualname)
+                    _write_file(outfile, content)
+    _save_cache(cache_path, entries)
+    try:
+        marker.touch()
+    except OSError:
+        pass
@@ -1,85 +1,80 @@
 from __future__ import annotations
 
+import functools
+import importlib
 import inspect
 import os
 import re
+import sys
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from docutils import nodes
 from docutils.statemachine import ViewList
 from sphinx import addnodes
 from sphinx.ext.autosummary import Autosummary
 from sphinx.util.nodes import nested_parse_with_titles
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
 from sphinx.util import logging
 
-try:  # Sphinx >= 5
-    from sphinx.ext.autosummary.generate import import_by_name  # type: ignore
-except Exception:  # pragma: no cover - fallback
-    import importlib
-
-    def import_by_name(name: str):  # type: ignore
-        modname, qualname = name, ""
-        obj = None
-        last_exc = None
-        while "." in modname:
-            try:
-                mod = importlib.import_module(modname)
-                obj = mod
-                for part in qualname.split("."):
-                    if not part:
-                        continue
-                    obj = getattr(obj, part)
-                # Emulate a shape compatible with Sphinx (name, obj, parent, modname, qualname)
-                return [(name, obj, None, modname, qualname)]
-            except Exception as e:  # keep walking up
-                last_exc = e
-                modname, tail = modname.rsplit(".", 1)
-                qualname = tail + ("." + qualname if qualname else "")
-        if last_exc:
-            raise last_exc
-        raise ImportError(f"Cannot import {name}")
-
 
 _RE_NOTE_BLOCK = re.compile(
     r"^\s*\.\.\s+note::\s*\n((?:\s{2,}.+\n?)+)", re.MULTILINE
 )
-_RE_PY_OBJ = re.compile(
-    r"^\s*\.\.\s+py:(?P<kind>class|function|method|attribute|property|module|data)::\s+(?P<name>[^\s(]+)(?:\s*\(.*)?\s*$"
+# '.. py:<kind>:: <name>[(args)]' header line, then its body up to the next
+# unindented directive
+_RE_CN_ANY_BLOCK = re.compile(
+    r"^[^\S\n]*\.\.[^\S\n]+py:(?:class|function|method|attribute|property|module|data)::[^\S\n]+"
+    r"(?P<name>[^\s(]+)(?:[^\S\n]*\([^\n]*)?[^\S\n]*$\n?(?P<body>.*?)(?=^\.\. |\Z)",
+    re.MULTILINE | re.DOTALL,
 )
+_RE_FIRST_TEXT = re.compile(r"\S[^\r\n]*")
+_RE_PLATFORMS = re.compile(r"Supported Platforms:(.*)$", re.MULTILINE)
 
 
 def _safe_read(path: Path) -> str:
+    # Several rows may resolve to the same (parent) RST; reuse reads until it changes
     try:
-        return path.read_text(encoding="utf-8")
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return ""
+    return _read_text_cached(str(path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_text_cached(path: str, mtime_ns: int) -> str:
+    # One unbuffered read of the whole file; skips TextIOWrapper setup
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            data = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        return data.decode("utf-8")
     except Exception:
         return ""
 
 
-def _dedent_block(text: str) -> str:
-    lines = text.splitlines()
-    # Compute minimal indent on non-empty lines
-    indents = [len(l) - len(l.lstrip()) for l in lines if l.strip()]
-    if not indents:
-        return text.strip()
-    cut = min(indents)
-    return "\n".join(l[cut:] for l in lines).strip()
+def _first_line(text: str) -> Optional[str]:
+    """First non-blank line of a block, stripped (no need to dedent the rest)."""
+    m = _RE_FIRST_TEXT.search(text)
+    return m.group(0).strip() if m else None
 
 
 def _first_paragraph(lines: List[str]) -> str:
     buf: List[str] = []
-    seen_text = False
     for ln in lines:
-        if not ln.strip():
-            if seen_text:
+        stripped = ln.strip()
+        if not stripped:
+            # blank line ends the first paragraph
+            if buf:
                 break
-            else:
-                continue
+            continue
         # skip directive and option lines
-        if ln.lstrip().startswith(".. ") or ln.lstrip().startswith(":"):
+        if ln.lstrip().startswith((".. ", ":")):
             continue
-        seen_text = True
-        buf.append(ln.strip())
+        buf.append(stripped)
     return " ".join(buf).strip()
 
 
@@ -87,6 +82,11 @@ def _indent_len(s: str) -> int:
     return len(s) - len(s.lstrip())
 
 
+@functools.lru_cache(maxsize=None)
+def _directive_pattern(name: str) -> re.Pattern:
+    return re.compile(r"^\s*\.\.\s+" + re.escape(name) + r"::(\s*.*)$")
+
+
 def _find_first_directive_block(text: str, name: str) -> Optional[str]:
     """Find the first '.. name::' block and return exact RST snippet.
 
@@ -94,13 +94,10 @@ def _find_first_directive_block(text: str, name: str) -> Optional[str]:
     is captured, preventing trailing paragraphs from being included.
     """
     lines = text.splitlines()
+    # match '.. name::' with optional arguments
+    match = _directive_pattern(name).match
     for i, ln in enumerate(lines):
-        stripped = ln.strip()
-        if not stripped.startswith(".. "):
-            continue
-        # match '.. name::' with optional arguments
-        m = re.match(r"^\s*\.\.\s+" + re.escape(name) + r"::(\s*.*)$", ln)
-        if not m:
+        if not match(ln):
             continue
         base = _indent_len(ln)
         j = i + 1
@@ -131,61 +128,167 @@ def _extract_docstring_section(doc: str, kind: str) -> Optional[str]:
         m = _RE_NOTE_BLOCK.search(doc)
         if not m:
             return None
-        block = _dedent_block(m.group(1))
         # One-liner of the note
-        first = block.splitlines()[0].strip()
-        return first
+        return _first_line(m.group(1))
     if kind == "platform":
-        # Look for 'Supported Platforms:' lines
-        for ln in doc.splitlines():
-            if "Supported Platforms:" in ln:
-                return ln.split("Supported Platforms:", 1)[1].strip()
-        return None
+        # Look for the first 'Supported Platforms:' line
+        m = _RE_PLATFORMS.search(doc)
+        if not m:
+            return None
+        return m.group(1).strip()
     return None
 
 
+@functools.lru_cache(maxsize=4096)
+def _cached_import_by_fullname(fullname: str) -> Tuple[Any, Optional[str], Optional[str]]:
+    """Resolve a dotted name to (obj, module_name, qualname), memoized per name.
+
+    Walks up the dotted path like Sphinx's import_by_name, but looks modules up
+    in sys.modules first so already-imported ones skip the import machinery.
+    """
+    modname, qualname = fullname, ""
+    while modname:
+        mod = sys.modules.get(modname)
+        if mod is None:
+            try:
+                mod = importlib.import_module(modname)
+            except Exception:
+                mod = None
+        if mod is not None:
+            obj = mod
+            try:
+                for part in qualname.split(".") if qualname else ():
+                    obj = getattr(obj, part)
+            except Exception:
+                pass  # keep walking up
+            else:
+                return obj, modname, qualname
+        if "." not in modname:
+            break
+        modname, tail = modname.rsplit(".", 1)
+        qualname = tail + ("." + qualname if qualname else "")
+    return None, None, None
+
+
 def _import_object_by_fullname(fullname: str):
     """Try importing an object by fullname.
 
     Returns: (obj, module_name, qualname) or (None, None, None) on failure.
     """
+    return _cached_import_by_fullname(fullname)
+
+
+# Docstring-derived third-column kinds, in the order _docstring_sections returns them
+_SECTION_KINDS = ("math", "note", "platform")
+_SECTION_INDEX = {kind: i for i, kind in enumerate(_SECTION_KINDS)}
+
+
+@functools.lru_cache(maxsize=2048)
+def _docstring_sections(fullname: str) -> Tuple[Optional[str], ...]:
+    """Return the (math, note, platform) docstring sections of an object.
+
+    The same object typically appears in several autosummary tables, so the
+    docstring is fetched and scanned once per name.
+    """
+    obj, _mod, _qual = _import_object_by_fullname(fullname)
+    doc = (inspect.getdoc(obj) if obj is not None else None) or ""
+    return tuple(_extract_docstring_section(doc, kind) for kind in _SECTION_KINDS)
+
+
+def _missing_cn(env: BuildEnvironment) -> Dict[Tuple[str, str], List[str]]:
+    """Missing CN summaries recorded while reading: (docname, toctree) -> entries."""
+    if not hasattr(env, "mqdocs_missing_cn"):
+        env.mqdocs_missing_cn = {}  # type: ignore[attr-defined]
+    return env.mqdocs_missing_cn  # type: ignore[attr-defined]
+
+
+def on_env_purge_doc(app: Sphinx, env: BuildEnvironment, docname: str) -> None:
+    missing = _missing_cn(env)
+    for key in [k for k in missing if k[0] == docname]:
+        del missing[key]
+
+
+def on_env_merge_info(app: Sphinx, env: BuildEnvironment, docnames: Set[str], other: BuildEnvironment) -> None:
+    missing = _missing_cn(env)
+    for key, entries in _missing_cn(other).items():
+        if key[0] in docnames:
+            missing.setdefault(key, []).extend(entries)
+
+
+def on_env_updated(app: Sphinx, env: BuildEnvironment) -> None:
+    """Emit one consolidated warning per document for missing CN summaries.
+
+    Runs after reading and before the environment is pickled, so clearing the
+    records here keeps unchanged documents from being re-warned next build.
+    """
+    logger = logging.getLogger(__name__)
+    missing = _missing_cn(env)
+    for (docname, toctree_dir), entries in sorted(missing.items()):
+        logger.warning(
+            "CN autosummary: %d missing entries in doc=%s (toctree=%s): %s",
+            len(entries),
+            docname,
+            toctree_dir,
+            ", ".join(entries),
+            location=docname,
+        )
+    # Only report documents read in this build
+    missing.clear()
+
+
+def on_build_finished(app: Sphinx, exception: Optional[Exception]) -> None:
+    """Drop per-build caches so they do not outlive the build (or leak across workers)."""
+    _cached_import_by_fullname.cache_clear()
+    _docstring_sections.cache_clear()
+    _read_text_cached.cache_clear()
+    _find_cn_rst_path.cache_clear()
+    _dir_listing.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_listing(dir_str: str) -> frozenset:
     try:
-        res = import_by_name(fullname)
-    except Exception:
-        return None, None, None
-    if not res:
-        return None, None, None
-    item = res[0]
-    # Sphinx 7 may add extra fields; pick robustly
-    try:
-        obj = item[1]
-        modname = item[-2]
-        qualname = item[-1]
-    except Exception:
-        return None, None, None
-    return obj, modname, qualname
+        return frozenset(os.listdir(dir_str))
+    except OSError:
+        return frozenset()
 
 
+@functools.lru_cache(maxsize=None)
 def _find_cn_rst_path(srcdir: Path, current_docname: str, toctree_dir: Optional[str], fullname: str) -> Optional[Path]:
     # Current document directory
     current_doc_path = srcdir / (current_docname + ".rst")
     base_dir = current_doc_path.parent
     if toctree_dir:
         base_dir = (base_dir / toctree_dir).resolve()
-    candidates = [base_dir / (fullname + ".rst")]
+    # One listing per directory turns candidate checks into set lookups
+    names = _dir_listing(str(base_dir))
+    candidates = [fullname + ".rst"]
     # Also try by last component
     tail = fullname.rsplit(".", 1)[-1]
-    candidates.append(base_dir / (tail + ".rst"))
+    candidates.append(tail + ".rst")
     # Also try the parent object file for methods/attributes
     if "." in fullname:
         parent = fullname.rsplit(".", 1)[0]
-        candidates.append(base_dir / (parent + ".rst"))
+        candidates.append(parent + ".rst")
     for c in candidates:
-        if c.exists():
-            return c
+        if c in names:
+            return base_dir / c
     return None
 
 
+def _find_cn_block(text: str, fullname: str) -> Optional[re.Match]:
+    """First py directive block named fullname or its last component, else the first one."""
+    tail = fullname.rsplit(".", 1)[-1]
+    first = m = _RE_CN_ANY_BLOCK.search(text)
+    while m:
+        if m.group("name") in (fullname, tail):
+            return m
+        # Resume right after the header so indented (nested) directives inside
+        # this block's body are still considered
+        m = _RE_CN_ANY_BLOCK.search(text, m.start("body"))
+    return first
+
+
 def _extract_cn_from_rst(rst_path: Path, fullname: str) -> tuple[Optional[str], Optional[str], Optional[str]]:
     """Extract (summary, note, math) from a CN per-object RST file.
 
@@ -194,36 +297,15 @@ def _extract_cn_from_rst(rst_path: Path, fullname: str) -> tuple[Optional[str],
     text = _safe_read(rst_path)
     if not text:
         return None, None, None
-    lines = text.splitlines()
-    # Locate the py directive matching fullname or its tail
-    full = fullname
-    tail = fullname.rsplit(".", 1)[-1]
-    start_idx = None
-    for i, ln in enumerate(lines):
-        m = _RE_PY_OBJ.match(ln)
-        if not m:
-            continue
-        objname = m.group("name").strip()
-        if objname == full or objname == tail:
-            start_idx = i
-            break
-    if start_idx is None:
-        # Fallback: first py directive
-        for i, ln in enumerate(lines):
-            if _RE_PY_OBJ.match(ln):
-                start_idx = i
-                break
-    if start_idx is None:
+    # Locate the py directive matching fullname or its tail, falling back to
+    # the first py directive; the block runs until the next top-level directive
+    m = _find_cn_block(text, fullname)
+    if not m:
         return None, None, None
-
-    # Gather block under the directive (until next top-level directive or section)
-    block: List[str] = []
-    for ln in lines[start_idx + 1 :]:
-        # Stop on an unindented directive or section underline
-        if ln and not ln.startswith(" ") and ln.startswith(".. "):
-            break
-        block.append(ln)
-    block_text = "\n".join(block)
+    block_text = m.group("body")
+    if block_text.endswith("\n"):
+        block_text = block_text[:-1]
+    block = block_text.splitlines()
 
     # Summary: first paragraph skipping option lines
     summary = _first_paragraph(block)
@@ -233,7 +315,7 @@ def _extract_cn_from_rst(rst_path: Path, fullname: str) -> tuple[Optional[str],
     math = None
     m = _RE_NOTE_BLOCK.search(block_text)
     if m:
-        note = _dedent_block(m.group(1)).splitlines()[0].strip()
+        note = _first_line(m.group(1))
     rst = _find_first_directive_block(block_text, "math")
     if rst:
         math = rst
@@ -265,56 +347,51 @@ class _MsBaseAutosummary(Autosummary):
         ("cn", "note"): ("接口名", "概述", "说明"),
         ("cn", "platform"): ("接口名", "概述", "支持平台"),
     }
+    # Resolved per subclass from HEADERS
+    HEADER_LABELS: Tuple[str, ...] = HEADERS[("en", None)]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.HEADER_LABELS = cls.HEADERS[(cls.locale, cls.third_kind)]
 
     def _compute_third(self, real_name: str) -> Optional[str]:
         if not self.third_kind:
             return None
-        # CN platform derives from Python docstring; other CN kinds read from RST
-        if self.locale == "en" or self.third_kind == "platform":
-            obj, _mod, _qual = _import_object_by_fullname(real_name)
-            doc = inspect.getdoc(obj) if obj is not None else None
-            return _extract_docstring_section(doc or "", self.third_kind)
-        else:
-            # CN math/note from per-object RST
-            env = self.state.document.settings.env  # type: ignore[attr-defined]
-            toctree_dir = self.options.get("toctree")
-            rst_path = _find_cn_rst_path(Path(env.srcdir), env.docname, toctree_dir, real_name)
-            if not rst_path:
-                return None
-            _summary, note, math = _extract_cn_from_rst(rst_path, real_name)
-            if self.third_kind == "note":
-                return note
-            if self.third_kind == "math":
-                return math
-            return None
+        return _docstring_sections(real_name)[_SECTION_INDEX[self.third_kind]]
+
+    def _compute_cn_row(self, real_name: str) -> Tuple[str, Optional[str]]:
+        """Return (summary, third) for a CN row from one parse of its RST.
 
-    def _compute_cn_summary(self, real_name: str, current_summary: str) -> str:
+        CN platform derives from the Python docstring; math/note read from RST.
+        """
         env = self.state.document.settings.env  # type: ignore[attr-defined]
-        logger = logging.getLogger(__name__)
         warn_missing = bool(getattr(env.app.config, "mqdocs_warn_missing_cn_summary", True))
         toctree_dir = self.options.get("toctree")
         rst_path = _find_cn_rst_path(Path(env.srcdir), env.docname, toctree_dir, real_name)
+        summary = note = math = None
+        missing: Optional[str] = None
         if not rst_path:
             # Strict CN behavior: do not fall back to docstrings
-            if warn_missing:
-                logger.warning(
-                    "CN autosummary: RST not found for %s (doc=%s, toctree=%s)",
-                    real_name,
-                    env.docname,
-                    toctree_dir or "",
-                )
-            return ""
-        summary, _note, _math = _extract_cn_from_rst(rst_path, real_name)
-        # Strict CN behavior: blank if missing
-        if not (summary and summary.strip()):
-            if warn_missing:
-                logger.warning(
-                    "CN autosummary: missing summary in %s for %s",
-                    rst_path,
-                    real_name,
-                )
-            return ""
-        return summary
+            missing = f"{real_name} (RST not found)"
+        else:
+            summary, note, math = _extract_cn_from_rst(rst_path, real_name)
+            # Strict CN behavior: blank if missing
+            if not (summary and summary.strip()):
+                summary = None
+                missing = f"{real_name} (no summary in {rst_path.name})"
+        if missing and warn_missing:
+            # Reported once per document by on_env_updated
+            _missing_cn(env).setdefault((env.docname, toctree_dir or ""), []).append(missing)
+
+        if self.third_kind == "platform":
+            third = self._compute_third(real_name)
+        elif self.third_kind == "note":
+            third = note
+        elif self.third_kind == "math":
+            third = math
+        else:
+            third = None
+        return summary or "", third
 
     # Suppress "include current module" warnings by clearing current-module context
     def get_items(self, names: Sequence[str]):  # type: ignore[override]
@@ -346,29 +423,26 @@ class _MsBaseAutosummary(Autosummary):
         enriched: List[Tuple[str, str, str, str, Optional[str]]] = []
         for name, sig, summary, real_name in items:
             if self.locale == "cn":
-                summary = self._compute_cn_summary(real_name, summary)
-            third = self._compute_third(real_name)
+                summary, third = self._compute_cn_row(real_name)
+            else:
+                third = self._compute_third(real_name)
             enriched.append((name, sig, summary, real_name, third))
 
         # Build a docutils table manually
+        num_cols = len(self.HEADER_LABELS)
         table = nodes.table()
-        tgroup = nodes.tgroup(cols=3 if self.third_kind else 2)
+        tgroup = nodes.tgroup(cols=num_cols)
         table += tgroup
-        for _ in range(3 if self.third_kind else 2):
+        for _ in range(num_cols):
             tgroup += nodes.colspec(colwidth=1)
         thead = nodes.thead()
         tgroup += thead
         tbody = nodes.tbody()
         tgroup += tbody
 
-        header_labels = self.HEADERS[(self.locale, self.third_kind)]
-        header_row = nodes.row()
-        for label in header_labels:
-            entry = nodes.entry()
-            para = nodes.paragraph(text=str(label))
-            entry += para
-            header_row += entry
-        thead += header_row
+        thead += nodes.row(
+            "", *(nodes.entry("", nodes.paragraph(text=label)) for label in self.HEADER_LABELS)
+        )
 
         for name, sig, summary, real_name, third in enriched:
             row = nodes.row()
@@ -4,8 +4,21 @@ import re
 from typing import List
 
 
-_RE_METHOD = re.compile(r"^(?P<indent>\s*)\.\.\s+py:method::\s+(?P<sig>[^\n]+?)\s*$")
-_RE_OPTION_PROPERTY = re.compile(r"^\s*:property:\s*$")
+# A '.. py:method::' header plus its directive block: blank lines and lines
+# indented deeper than the header
+_RE_METHOD_BLOCK = re.compile(
+    r"^(?P<indent> *)\.\.[^\S\n]+py:method::[^\S\n]+(?P<sig>[^\n]*?)[^\S\n]*(?:\n|\Z)"
+    r"(?P<body>(?:[^\S\n]*\n|[^\S\n]+\Z|(?P=indent) +[^\n]*(?:\n|\Z))*)",
+    re.MULTILINE,
+)
+_RE_OPTION_PROPERTY = re.compile(r"^[^\S\n]*:property:[^\S\n]*(?:\n|\Z)", re.MULTILINE)
+
+
+def _method_to_property(m: re.Match) -> str:
+    body, found_property = _RE_OPTION_PROPERTY.subn("", m.group("body"))
+    if not found_property:
+        return m.group(0)
+    return f"{m.group('indent')}.. py:property:: {m.group('sig')}\n{body}"
 
 
 def normalize_py_property_option(app, docname: str, source: List[str]) -> None:
@@ -18,47 +31,7 @@ def normalize_py_property_option(app, docname: str, source: List[str]) -> None:
     if not source:
         return
     text = source[0]
-    lines = text.splitlines(keepends=True)
-    out: List[str] = []
-    i = 0
-
-    while i < len(lines):
-        m = _RE_METHOD.match(lines[i])
-        if not m:
-            out.append(lines[i])
-            i += 1
-            continue
-
-        base_indent = len(m.group("indent"))
-        sig = m.group("sig").strip()
-        # collect the directive block (options and content) indented beyond base
-        block = [lines[i]]
-        i += 1
-        j = i
-        found_property = False
-        while j < len(lines):
-            ln = lines[j]
-            if ln.strip() == "":
-                block.append(ln)
-                j += 1
-                continue
-            indent = len(ln) - len(ln.lstrip(" "))
-            if indent <= base_indent:
-                break
-            # detect and drop the ':property:' option line
-            if _RE_OPTION_PROPERTY.match(ln):
-                found_property = True
-                j += 1
-                continue
-            block.append(ln)
-            j += 1
-
-        if found_property:
-            out.append(" " * base_indent + f".. py:property:: {sig}\n")
-            out.extend(block[1:])
-        else:
-            out.extend(block)
-        i = j
-
-    source[0] = "".join(out)
-
+    # Most sources have neither marker; then there is nothing to rewrite
+    if "py:method::" not in text or ":property:" not in text:
+        return
+    source[0] = _RE_METHOD_BLOCK.sub(_method_to_property, text)
@@ -9,22 +9,51 @@ It writes docs/<lang>/_toc.yml for langs: en, zh.
 """
 from __future__ import annotations
 
+import functools
+import io
+import os
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 
 
-def has_dir(base: Path, name: str) -> bool:
-    return (base / name).is_dir()
+def _list_names(src: Path) -> set[str]:
+    """Names of all entries directly in src (one scandir; empty if missing)."""
+    try:
+        with os.scandir(src) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+def _has_any(names: set[str], stem: str, exts: tuple[str, ...] = (".rst", ".md")) -> bool:
+    return any(stem + ext in names for ext in exts)
+
+
+def _dir_mtime_ns(path: Path) -> int:
+    """mtime of path itself (0 if missing); it changes when entries are added or removed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
 
 
 def gen_toc_for(lang: str) -> str:
+    # The TOC only depends on which entries exist directly in src/, so the
+    # directory's own mtime is a sufficient cache key
+    src = ROOT / "docs" / lang / "src"
+    return _gen_toc_cached(lang, _dir_mtime_ns(src))
+
+
+@functools.lru_cache(maxsize=8)
+def _gen_toc_cached(lang: str, src_mtime_ns: int) -> str:
     base = ROOT / "docs" / lang
     src = base / "src"
+    names = _list_names(src)
 
     # Build YAML content with glob-based sections to auto-include content.
     # Keep the root minimal and let parts/chapters drive the sidebar.
-    lines: list[str] = []
+    buf = io.StringIO()
     apidirs = [
         ("mindquantum.dtype", "dtype"),
         ("mindquantum.core", "core"),
@@ -37,14 +66,14 @@ def gen_toc_for(lang: str) -> str:
         ("mindquantum.utils", "utils"),
     ]
 
-    lines.append("format: jb-book")
-    lines.append("root: src/index")
-    lines.append("")
-    lines.append("parts:")
+    buf.write("format: jb-book\n")
+    buf.write("root: src/index\n")
+    buf.write("\n")
+    buf.write("parts:\n")
 
     # Tutorials
-    lines.append("- caption: Tutorials")
-    lines.append("  chapters:")
+    buf.write("- caption: Tutorials\n")
+    buf.write("  chapters:\n")
     tutorial_sections = [
         ("beginner/beginner", "beginner"),
         ("middle_level/middle_level", "middle_level"),
@@ -52,29 +81,38 @@ def gen_toc_for(lang: str) -> str:
         ("case_library/case_library", "case_library"),
     ]
     for topfile, folder in tutorial_sections:
-        if not (src / folder).exists():
+        if folder not in names:
             continue
-        lines.append(f"  - file: src/{topfile}")
+        buf.write(f"  - file: src/{topfile}\n")
         # Include all pages in that folder. Use one-level glob to avoid duplicating the topfile.
-        lines.append("    sections:")
-        lines.append(f"    - glob: src/{folder}/*")
+        buf.write("    sections:\n")
+        buf.write(f"    - glob: src/{folder}/*\n")
 
     # No API Reference in Jupyter Books; linked from site nav to Sphinx builds.
 
     # References / Misc
-    lines.append("- caption: Reference")
-    lines.append("  chapters:")
+    buf.write("- caption: Reference\n")
+    buf.write("  chapters:\n")
     for fname in ("mindquantum_install", "paper_with_code", "RELEASE"):
-        if (src / f"{fname}.rst").exists() or (src / f"{fname}.md").exists():
-            lines.append(f"  - file: src/{fname}")
+        if _has_any(names, fname):
+            buf.write(f"  - file: src/{fname}\n")
 
-    return "\n".join(lines) + "\n"
+    return buf.getvalue()
 
 
 def write_toc(lang: str) -> None:
     toc = gen_toc_for(lang)
     out = ROOT / "docs" / lang / "_toc.yml"
-    out.write_text(toc, encoding="utf-8")
+    data = toc.encode("utf-8")
+    try:
+        existing = out.read_bytes()
+    except FileNotFoundError:
+        existing = None
+    # Leave an identical file alone so its mtime does not trigger rebuilds
+    if existing == data:
+        print(f"{out} unchanged")
+        return
+    out.write_bytes(data)
     print(f"Wrote {out}")
 
 
@@ -11,10 +11,15 @@ Usage:
 """
 from __future__ import annotations
 import argparse
-import runpy
+import subprocess
 import sys
 from pathlib import Path
 
+try:
+    from .upstream_utils import ensure_all
+except Exception:
+    from upstream_utils import ensure_all  # type: ignore
+
 
 def main() -> None:
     parser = argparse.ArgumentParser()
@@ -23,20 +28,34 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    # Propagate --update to sub-scripts by injecting argv
-    sub_argv = ["--update"] if args.update else []
+    # Clone/update upstreams once up front: both sub-scripts read the
+    # mindquantum clone, so letting them fetch it concurrently would race.
+    # They then find cached checkouts and need no --update of their own.
+    try:
+        ensure_all(update=args.update)
+        fetched = True
+    except SystemExit as e:
+        print(f"WARN: upstream fetch failed ({e}); sync scripts will retry one at a time")
+        fetched = False
 
     scripts_dir = Path(__file__).resolve().parent
-
-    # Run tutorial sync
-    sys.argv = ["sync_mindquantum_from_msdocs.py", *sub_argv]
-    runpy.run_path(
-        str(scripts_dir / "sync_mindquantum_from_msdocs.py"), run_name="__main__"
-    )
-
-    # Run API sync
-    sys.argv = ["sync_mindquantum_api.py", *sub_argv]
-    runpy.run_path(str(scripts_dir / "sync_mindquantum_api.py"), run_name="__main__")
+    cmds = [
+        [sys.executable, str(scripts_dir / script)]
+        for script in ("sync_mindquantum_from_msdocs.py", "sync_mindquantum_api.py")
+    ]
+
+    if fetched:
+        # Tutorial and API syncs write disjoint trees; run them as parallel processes
+        procs = [subprocess.Popen(cmd) for cmd in cmds]
+        codes = [p.wait() for p in procs]
+    else:
+        # Clones may still be missing; sequential runs keep both scripts from
+        # cloning mindquantum into the same directory at once
+        sub_argv = ["--update"] if args.update else []
+        codes = [subprocess.call([*cmd, *sub_argv]) for cmd in cmds]
+    failed = next((code for code in codes if code), 0)
+    if failed:
+        raise SystemExit(failed)
 
 
 if __name__ == "__main__":
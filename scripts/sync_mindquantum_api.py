@@ -13,13 +13,14 @@ If a source directory is missing, it is skipped.
 """
 from __future__ import annotations
 import argparse
-import shutil
 from pathlib import Path
 
 try:
     from .upstream_utils import ensure_repo
+    from .sync_utils import copy_files, plan_copy, prune_stale_many
 except Exception:
     from upstream_utils import ensure_repo  # type: ignore
+    from sync_utils import copy_files, plan_copy, prune_stale_many  # type: ignore
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -28,14 +29,12 @@ DEST_API_ZH = ROOT / "docs" / "api-zh" / "api_python"
 
 
 def copy_into(src: Path, dst: Path) -> None:
-    for item in src.iterdir():
-        target = dst / item.name
-        if item.is_dir():
-            if target.exists():
-                shutil.rmtree(target)
-            shutil.copytree(item, target)
-        else:
-            shutil.copy2(item, target)
+    # Subdirectories mirror upstream exactly; top-level files are overwritten
+    # and other local top-level entries are kept
+    pairs = plan_copy(src, dst)
+    copy_files(pairs)
+    # Per-module subtrees (mindquantum.core, .simulator, ...) prune concurrently
+    prune_stale_many([dst / item.name for item in src.iterdir() if item.is_dir()], pairs)
 
 
 def main() -> None:
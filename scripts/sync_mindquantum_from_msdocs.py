@@ -12,16 +12,16 @@ Usage:
 The build remains independent; this script vendors content as needed.
 """
 from __future__ import annotations
-import os
 import argparse
-import shutil
 from pathlib import Path
 
 try:
     # Local helper to auto-clone upstreams
     from .upstream_utils import ensure_repo
+    from .sync_utils import copy_files, plan_copy, prune_stale
 except Exception:
     from upstream_utils import ensure_repo  # type: ignore
+    from sync_utils import copy_files, plan_copy, prune_stale  # type: ignore
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -37,36 +37,23 @@ SKIP_NAMES = {"conf.py", "_templates"}
 def copy_tree_filtered(src: Path, dst: Path) -> None:
     if not src.exists():
         raise FileNotFoundError(f"Source path missing: {src}")
-    if dst.exists():
-        shutil.rmtree(dst)
     dst.mkdir(parents=True, exist_ok=True)
-    for root, dirs, files in os.walk(src):
-        rel_root = Path(root).relative_to(src)
-        # filter directories
-        dirs[:] = [d for d in dirs if d not in SKIP_NAMES]
-        # ensure directory exists
-        (dst / rel_root).mkdir(parents=True, exist_ok=True)
-        # copy files, skipping unwanted
-        for f in files:
-            if f in SKIP_NAMES:
-                continue
-            src_file = Path(root) / f
-            dst_file = dst / rel_root / f
-            shutil.copy2(src_file, dst_file)
+    # Walk once to plan (skipping unwanted names), copy changed files in
+    # parallel, then drop anything upstream no longer has
+    pairs = plan_copy(src, dst, SKIP_NAMES)
+    copy_files(pairs)
+    prune_stale(dst, pairs)
 
 
 def write_release_pages(mq_repo: Path) -> None:
     en_src = mq_repo / "RELEASE.md"
     zh_src = mq_repo / "RELEASE_CN.md"
+    # Byte-level copies: no decode/encode round-trip of the changelogs
     if en_src.exists():
-        (DEST_EN / "RELEASE.md").write_text(
-            en_src.read_text(encoding="utf-8"), encoding="utf-8"
-        )
+        copy_files([(en_src, DEST_EN / "RELEASE.md")])
         print(f'Wrote EN release → {DEST_EN / "RELEASE.md"}')
     if zh_src.exists():
-        (DEST_ZH / "RELEASE.md").write_text(
-            zh_src.read_text(encoding="utf-8"), encoding="utf-8"
-        )
+        copy_files([(zh_src, DEST_ZH / "RELEASE.md")])
         print(f'Wrote ZH release → {DEST_ZH / "RELEASE.md"}')
 
 
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Shared file-tree copy helpers for the upstream sync scripts.
+
+Copies are split in two phases:
+- plan: a single-threaded walk that collects (src_file, dst_file) pairs, then
+  creates each needed destination directory once;
+- copy: the per-file copies, run on a thread pool so open/read/write syscalls
+  overlap (shutil releases the GIL while copying).
+
+Copies are incremental: files whose size and mtime already match are left
+untouched, so unchanged docs keep their mtimes and Sphinx does not re-read
+them. Only contents are copied per file; source timestamps are applied to the
+copied files in one pass afterwards (permissions are not copied, docs trees
+do not need them). prune_stale removes destination files that no longer exist
+upstream.
+"""
+from __future__ import annotations
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+PRUNE_WORKERS = 8
+# Bytes per copy_file_range call; the kernel may copy less and we loop
+_COPY_CHUNK = 1 << 30
+
+
+def _walk(
+    src: Path, dst: Path, skip: frozenset[str]
+) -> Iterator[tuple[Path, Path, list[str]]]:
+    """Yield (src_dir, dst_dir, file names) for src and each subdirectory.
+
+    Directories come before their children. Entries named in skip are pruned.
+    Like os.walk, symlinked directories are neither descended into nor listed;
+    DirEntry's cached type answers both checks without an extra stat on most
+    filesystems.
+    """
+    files: list[str] = []
+    subdirs: list[str] = []
+    with os.scandir(src) as it:
+        for entry in it:
+            if entry.name in skip:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.name)
+            elif not entry.is_dir():
+                files.append(entry.name)
+    yield src, dst, files
+    for name in subdirs:
+        yield from _walk(src / name, dst / name, skip)
+
+
+def plan_copy(
+    src: Path, dst: Path, skip: Iterable[str] = ()
+) -> list[tuple[Path, Path]]:
+    """Collect file pairs under src (minus names in skip) and create their dirs."""
+    pairs: list[tuple[Path, Path]] = []
+    dirs_needed: list[Path] = []
+    # Directory paths are built once per directory; only the leaf join is per file
+    for src_dir, dst_dir, files in _walk(src, dst, frozenset(skip)):
+        if files:
+            pairs.extend((src_dir / f, dst_dir / f) for f in files)
+            dirs_needed.append(dst_dir)
+    # One mkdir per destination directory; the walk yields parents first
+    for d in dirs_needed:
+        d.mkdir(parents=True, exist_ok=True)
+    return pairs
+
+
+def fast_copy(src: Path, dst: Path) -> None:
+    """Copy file contents like shutil.copyfile, moving the bytes in-kernel when possible.
+
+    Uses os.copy_file_range (Linux >= 4.5; may reflink or share page cache) so
+    data never passes through user-space buffers; falls back to shutil.copyfile
+    where it is unavailable or refused (e.g. across filesystems on old kernels),
+    or when it reports EOF early (some kernel/filesystem combinations return 0
+    without copying anything).
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        shutil.copyfile(src, dst)
+        return
+    try:
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            size = os.fstat(src_fd).st_size
+            copied = 0
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                while True:
+                    n = copy_range(src_fd, dst_fd, _COPY_CHUNK)
+                    if not n:
+                        break
+                    copied += n
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    except OSError:
+        shutil.copyfile(src, dst)
+        return
+    if copied != size:
+        # Short copy; redo it through user space rather than keep a truncated file
+        shutil.copyfile(src, dst)
+
+
+def copy_if_changed(src: Path, dst: Path) -> Optional[tuple[int, int]]:
+    """Copy src's contents to dst unless dst already has its size and mtime.
+
+    Returns src's (atime_ns, mtime_ns) for the caller to apply, or None if
+    nothing was copied.
+    """
+    s = src.stat()
+    try:
+        d = dst.stat()
+        if s.st_size == d.st_size and int(s.st_mtime) == int(d.st_mtime):
+            return None
+    except FileNotFoundError:
+        pass
+    fast_copy(src, dst)
+    return s.st_atime_ns, s.st_mtime_ns
+
+
+def copy_files(pairs: list[tuple[Path, Path]]) -> None:
+    """Copy planned pairs concurrently; the first failure is re-raised."""
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as ex:
+        times = list(ex.map(lambda pair: copy_if_changed(*pair), pairs))
+    # Carry source timestamps over to the files that were actually copied
+    for (_src_file, dst_file), ns in zip(pairs, times):
+        if ns is not None:
+            os.utime(dst_file, ns=ns)
+
+
+def prune_stale(dst: Path, pairs: list[tuple[Path, Path]]) -> None:
+    """Delete files under dst that are not planned targets, then emptied dirs."""
+    _prune(dst, {dst_file for _src_file, dst_file in pairs})
+
+
+def prune_stale_many(roots: list[Path], pairs: list[tuple[Path, Path]]) -> None:
+    """prune_stale for several disjoint subtrees, overlapping their unlink/rmdir calls."""
+    keep = {dst_file for _src_file, dst_file in pairs}
+    with ThreadPoolExecutor(max_workers=PRUNE_WORKERS) as ex:
+        list(ex.map(lambda root: _prune(root, keep), roots))
+
+
+def _prune(dst: Path, keep: set[Path]) -> None:
+    for root, dirs, files in os.walk(dst, topdown=False):
+        root_path = Path(root)
+        for f in files:
+            path = root_path / f
+            if path not in keep:
+                path.unlink()
+        if root_path != dst and not any(root_path.iterdir()):
+            root_path.rmdir()
@@ -6,21 +6,31 @@ Design goals:
 - No external deps; uses git CLI via subprocess.
 - Deterministic local layout under <repo-root>/.upstreams (configurable).
 - Shallow clones by default for speed; can update on demand.
+- Sparse checkouts: fresh clones only materialize the configured subpaths.
 - Graceful offline behavior: if fetch fails but a local copy exists, proceed.
 
 Config lives in scripts/upstreams.json with shape:
 {
   "baseDir": ".upstreams",
   "repos": {
-    "mindspore-docs": {"url": "https://...", "ref": "master"},
-    "mindquantum": {"url": "https://...", "ref": "master"}
+    "mindspore-docs": {"url": "https://...", "ref": "master",
+                       "sparse": ["docs/mindquantum/docs"]},
+    "mindquantum": {"url": "https://...", "ref": "master",
+                    "sparse": ["docs/api_python", "docs/api_python_en"]}
   }
 }
+
+"sparse" lists directories for a cone-mode sparse checkout (top-level files
+such as RELEASE.md are always included); omit it to check out the full tree.
 """
 from __future__ import annotations
+import functools
 import json
 import os
+import re
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -28,6 +38,8 @@ from typing import Optional
 ROOT = Path(__file__).resolve().parents[1]
 CFG_PATH = ROOT / 'scripts' / 'upstreams.json'
 
+_HEX_RE = re.compile(r'[0-9a-fA-F]{7,}')
+
 
 @dataclass
 class Upstream:
@@ -36,7 +48,9 @@ class Upstream:
     ref: Optional[str] = None
 
 
+@functools.lru_cache(maxsize=1)
 def _load_config():
+    # Parsed once per process; ensure_all and each ensure_repo share the result
     # Defaults are sensible and can be overridden via JSON config
     default = {
         'baseDir': '.upstreams',
@@ -44,17 +58,18 @@ def _load_config():
             'mindspore-docs': {
                 'url': 'https://gitee.com/mindspore/docs.git',
                 'ref': 'master',
+                'sparse': ['docs/mindquantum/docs'],
             },
             'mindquantum': {
                 'url': 'https://gitee.com/mindspore/mindquantum.git',
                 'ref': 'master',
+                'sparse': ['docs/api_python', 'docs/api_python_en'],
             },
         },
     }
     if CFG_PATH.exists():
         try:
-            with CFG_PATH.open('r', encoding='utf-8') as f:
-                cfg = json.load(f)
+            cfg = json.loads(CFG_PATH.read_text(encoding='utf-8'))
             # shallow-merge defaults to allow partial overrides
             merged = default
             if 'baseDir' in cfg:
@@ -67,23 +82,24 @@ def _load_config():
     return default
 
 
-def _run_git(args: list[str], cwd: Optional[Path] = None, check: bool = True) -> subprocess.CompletedProcess:
-    return subprocess.run(['git', *args], cwd=str(cwd) if cwd else None, check=check, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+def _run_git(args: list[str], cwd: Optional[Path] = None, check: bool = True, capture: bool = False) -> subprocess.CompletedProcess:
+    # stderr is always kept for error messages; stdout only when the caller reads it
+    stdout = subprocess.PIPE if capture else subprocess.DEVNULL
+    return subprocess.run(['git', *args], cwd=str(cwd) if cwd else None, check=check, stdout=stdout, stderr=subprocess.PIPE)
 
 
+@functools.lru_cache(maxsize=32)
 def _looks_like_commit(ref: str) -> bool:
     # loose heuristic: 7+ hex chars
-    if not ref:
-        return False
-    hexdigits = set('0123456789abcdefABCDEF')
-    return len(ref) >= 7 and all(c in hexdigits for c in ref)
+    return bool(ref) and _HEX_RE.fullmatch(ref) is not None
 
 
 def ensure_repo(name: str, update: bool = False) -> Path:
     """
     Ensure an upstream repo is available locally and optionally updated.
 
-    - If not present, shallow clone the configured ref (if any).
+    - If not present, shallow clone the configured ref (if any), checking out
+      only the configured sparse paths. Existing clones keep their layout.
     - If present and update=True, try to fetch the configured ref and checkout.
     - On network errors, keep existing working tree and continue.
     """
@@ -94,34 +110,64 @@ def ensure_repo(name: str, update: bool = False) -> Path:
     info = repos[name]
     url = info.get('url')
     ref = info.get('ref')
+    sparse = info.get('sparse') or []
     base = ROOT / cfg.get('baseDir', '.upstreams')
     base.mkdir(parents=True, exist_ok=True)
     dest = base / name
 
     def log(msg: str):
-        print(f'[upstreams] {name}: {msg}')
+        # Single write per line so concurrent ensure_repo calls do not interleave
+        print(f'[upstreams] {name}: {msg}\n', end='', flush=True)
 
     if not (dest / '.git').exists():
         # Fresh clone
         log(f'Cloning {url} → {dest}')
+        # With sparse paths, defer the checkout until the cone is configured
+        no_checkout = ['--no-checkout'] if sparse else []
         try:
             if ref and not _looks_like_commit(ref):
-                _run_git(['clone', '--filter=blob:none', '--no-tags', '--depth', '1', '--branch', ref, url, str(dest)])
+                _run_git(['clone', '--filter=blob:none', '--no-tags', '--depth', '1', *no_checkout, '--branch', ref, url, str(dest)])
             else:
-                _run_git(['clone', '--filter=blob:none', url, str(dest)])
+                _run_git(['clone', '--filter=blob:none', *no_checkout, url, str(dest)])
         except subprocess.CalledProcessError as e:
             raise SystemExit(f'Failed to clone {url}: {e.stderr.decode("utf-8", errors="ignore").strip()}')
+        if sparse:
+            try:
+                _run_git(['sparse-checkout', 'init', '--cone'], cwd=dest)
+                _run_git(['sparse-checkout', 'set', *sparse], cwd=dest)
+            except subprocess.CalledProcessError as e:
+                # e.g. git < 2.25 has no sparse-checkout; a full checkout still works
+                log(f'WARN: sparse-checkout failed; checking out full tree ({e.stderr.decode("utf-8", errors="ignore").strip()})')
+                _run_git(['sparse-checkout', 'disable'], cwd=dest, check=False)
+        checked_out = False
         # If ref is a commit-ish (tag/sha), try to checkout specifically
         if ref and _looks_like_commit(ref):
             try:
                 _run_git(['fetch', '--tags', 'origin'], cwd=dest)
                 _run_git(['checkout', ref], cwd=dest)
+                checked_out = True
             except subprocess.CalledProcessError:
                 log(f'WARN: Failed to checkout ref {ref}; keeping default branch')
+        if sparse and not checked_out:
+            # --no-checkout left the working tree empty; populate the cloned HEAD
+            # (blobs are only downloaded now, so this can still hit the network)
+            try:
+                _run_git(['checkout', 'HEAD'], cwd=dest)
+            except subprocess.CalledProcessError as e:
+                # Do not leave a .git behind: later runs would treat the empty
+                # tree as a cached checkout instead of cloning again
+                shutil.rmtree(dest, ignore_errors=True)
+                raise SystemExit(f'Failed to checkout {url}: {e.stderr.decode("utf-8", errors="ignore").strip()}')
         return dest
 
     # Existing clone
     if update:
+        if ref and _looks_like_commit(ref):
+            # A pinned SHA cannot move; skip the fetch if HEAD is already there
+            head = _run_git(['rev-parse', 'HEAD'], cwd=dest, check=False, capture=True)
+            if head.returncode == 0 and head.stdout.decode('ascii', errors='ignore').strip().startswith(ref.lower()):
+                log(f'Already at pinned {ref}')
+                return dest
         try:
             log('Fetching updates…')
             if ref and not _looks_like_commit(ref):
@@ -148,7 +194,9 @@ def ensure_repo(name: str, update: bool = False) -> Path:
 def ensure_all(update: bool = False) -> dict[str, Path]:
     cfg = _load_config()
     names = list(cfg.get('repos', {}).keys())
-    return {name: ensure_repo(name, update=update) for name in names}
+    # Clones/fetches are independent network-bound git subprocesses; run them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, len(names))) as ex:
+        return dict(zip(names, ex.map(lambda n: ensure_repo(n, update=update), names)))
 
 
 if __name__ == '__main__':